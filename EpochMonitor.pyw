@@ -73,7 +73,6 @@ class UserSettings:
         
         if old_version and old_version != new_version:
             history = self.settings.get("build_version_history", [])
-            from datetime import datetime
             history.append({
                 "from_version": old_version,
                 "to_version": new_version,
@@ -445,9 +444,9 @@ class ServerMonitorThread(QThread):
         
     def run(self):
         while self.running and not self._stop_event.is_set():
-            start_time = time.time()
+            start_time = time.perf_counter()
             is_up = self.check_server()
-            check_duration = time.time() - start_time
+            check_duration = time.perf_counter() - start_time
             
             self.status_update.emit(self.server_name, is_up, check_duration)
             
@@ -550,9 +549,9 @@ class ServerMonitorThread(QThread):
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.settimeout(3)
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = sock.connect_ex((host, self.port))
-            connect_time = time.time() - start_time
+            connect_time = time.perf_counter() - start_time
             
             if result == 0:
                 # Connection successful, now test if server is actually accepting game connections
@@ -566,12 +565,6 @@ class ServerMonitorThread(QThread):
                 except Exception as e:
                     # If any error occurs, assume server is rejecting connections
                     return False
-                finally:
-                    # Ensure socket is always closed
-                    try:
-                        sock.close()
-                    except:
-                        pass
             else:
                 return False
                 
@@ -661,19 +654,14 @@ class ServerCard(QWidget):
         self.last_check_time = None
         self.is_monitoring_disabled = False
         self.is_starting = False
+        self._card_style = None
+        self._status_display = None
         
         self.init_ui()
     
     def init_ui(self):
         """Initialize the server card UI"""
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #404040;
-                border: 2px solid #555555;
-                border-radius: 8px;
-                margin: 2px;
-            }
-        """)
+        self._set_card_style()
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(12, 8, 12, 8)
@@ -765,19 +753,8 @@ class ServerCard(QWidget):
             status_text = "TIMEOUT"
             color = timeout_color
         
-        self.status_text.setText(status_text)
-        self.status_text.setStyleSheet(f"font-weight: bold; font-size: 12px; color: {color};")
-        self.status_indicator.setStyleSheet(f"color: {color}; font-size: 20px;")
-        
-        border_color = color
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: #404040;
-                border: 2px solid {border_color};
-                border-radius: 8px;
-                margin: 2px;
-            }}
-        """)
+        self._set_status_display(status_text, color)
+        self._set_card_style(border_color=color)
         
         # Update uptime
         if self.total_checks > 0:
@@ -792,18 +769,8 @@ class ServerCard(QWidget):
         self.is_monitoring_disabled = False
         self.is_starting = True
         
-        self.status_text.setText("STARTING...")
-        self.status_text.setStyleSheet("font-weight: bold; font-size: 12px; color: #64b5f6;")  # Blue color
-        self.status_indicator.setStyleSheet("color: #64b5f6; font-size: 20px;")
-        
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #404040;
-                border: 2px solid #64b5f6;
-                border-radius: 8px;
-                margin: 2px;
-            }
-        """)
+        self._set_status_display("STARTING...", "#64b5f6")  # Blue color
+        self._set_card_style(border_color="#64b5f6")
         
         # Update last check to show it's initializing
         self.last_check_label.setText("Initializing...")
@@ -815,55 +782,53 @@ class ServerCard(QWidget):
         self.uptime_label.setText("Uptime: 0%")
         self.last_check_label.setText("Never")
         
-        # Reset to default appearance
-        self.status_text.setText("STOPPED")
-        self.status_text.setStyleSheet("font-weight: bold; font-size: 12px; color: #ffab40;")
-        self.status_indicator.setStyleSheet("color: #757575; font-size: 20px;")
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #404040;
-                border: 2px solid #555555;
-                border-radius: 8px;
-                margin: 2px;
-            }
-        """)
-        
-        # Clear all states when resetting
-        self.is_monitoring_disabled = False
-        self.is_starting = False
+        # Reset to default appearance and clear all states
+        self.set_to_stopped_state()
     
     def set_to_disabled_state(self):
         """Set card to disabled monitoring state while keeping stats"""
         self.is_monitoring_disabled = True
         self.is_starting = False  # Clear starting state
         
-        self.status_text.setText("DISABLED")
-        self.status_text.setStyleSheet("font-weight: bold; font-size: 12px; color: #666666;")
-        self.status_indicator.setStyleSheet("color: #666666; font-size: 20px;")
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #353535;
-                border: 2px solid #444444;
-                border-radius: 8px;
-                margin: 2px;
-            }
-        """)
+        self._set_status_display("DISABLED", "#666666")
+        self._set_card_style(border_color="#444444", background_color="#353535")
 
     def set_to_enabled_state(self):
+        # Show the default "STOPPED" appearance until monitoring starts
+        self.set_to_stopped_state()
+
+    def set_to_stopped_state(self):
+        """Clear transient states and show the default STOPPED appearance"""
         self.is_monitoring_disabled = False
-        self.is_starting = False  # Clear starting state
+        self.is_starting = False
         
-        # Reset to default "STOPPED" appearance until monitoring starts
-        self.status_text.setText("STOPPED")
-        self.status_text.setStyleSheet("font-weight: bold; font-size: 12px; color: #ffab40;")
-        self.status_indicator.setStyleSheet("color: #757575; font-size: 20px;")
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #404040;
-                border: 2px solid #555555;
+        self._set_status_display("STOPPED", "#ffab40", indicator_color="#757575")
+        self._set_card_style()
+
+    def _set_status_display(self, text, color, indicator_color=None):
+        """Update the status text and indicator dot"""
+        # Most checks report the same status as last time; nothing to redraw then
+        display = (text, color, indicator_color or color)
+        if self._status_display == display:
+            return
+        self._status_display = display
+        self.status_text.setText(text)
+        self.status_text.setStyleSheet(f"font-weight: bold; font-size: 12px; color: {color};")
+        self.status_indicator.setStyleSheet(f"color: {indicator_color or color}; font-size: 20px;")
+
+    def _set_card_style(self, border_color="#555555", background_color="#404040"):
+        """Apply the card frame stylesheet shared by every state"""
+        # setStyleSheet re-polishes every child widget, so skip no-op changes
+        if self._card_style == (border_color, background_color):
+            return
+        self._card_style = (border_color, background_color)
+        self.setStyleSheet(f"""
+            QWidget {{
+                background-color: {background_color};
+                border: 2px solid {border_color};
                 border-radius: 8px;
                 margin: 2px;
-            }
+            }}
         """)
 
 class ServerMonitor(QMainWindow):
@@ -902,44 +867,59 @@ class ServerMonitor(QMainWindow):
         self.manifest_thread = None
         self.start_time = None
         self.max_log_lines = 25
+        self.log_lines = deque(maxlen=self.max_log_lines)
         
         self.threads_to_cleanup = []
         self.cleanup_timer = QTimer()
         self.cleanup_timer.timeout.connect(self._cleanup_finished_threads)
-        self.cleanup_timer.start(1000)
         
         self.init_ui()
         self.load_ui_settings()
         self.update_client_button_states()
 
+    def _queue_thread_cleanup(self, thread):
+        """Hand a stopping thread to the cleanup timer, waking it if idle"""
+        self.threads_to_cleanup.append(thread)
+        if not self.cleanup_timer.isActive():
+            self.cleanup_timer.start(1000)
+
     def _cleanup_finished_threads(self):
         if not self.threads_to_cleanup:
+            self.cleanup_timer.stop()
             return
         
-        cleaned_up = []
-        for thread in self.threads_to_cleanup[:]:
+        # Compact the list in place: keep pending threads at the front
+        threads = self.threads_to_cleanup
+        keep = 0
+        for thread in threads:
+            done = False
             try:
                 if thread.isFinished():
-                    cleaned_up.append(thread)
+                    done = True
                     thread.deleteLater()
                 elif not thread.running:
                     if not hasattr(thread, '_stop_time'):
-                        thread._stop_time = time.time()
-                    elif time.time() - thread._stop_time > 5:
+                        thread._stop_time = time.perf_counter()
+                    elif time.perf_counter() - thread._stop_time > 5:
                         thread.terminate()
-                        cleaned_up.append(thread)
+                        done = True
                 elif hasattr(self, '_shutting_down') and self._shutting_down:
                     if not hasattr(thread, '_stop_time'):
-                        thread._stop_time = time.time()
-                    elif time.time() - thread._stop_time > 2:
+                        thread._stop_time = time.perf_counter()
+                    elif time.perf_counter() - thread._stop_time > 2:
                         thread.terminate()
-                        cleaned_up.append(thread)
+                        done = True
             except Exception:
-                cleaned_up.append(thread)
+                done = True
+            
+            if not done:
+                threads[keep] = thread
+                keep += 1
+        
+        del threads[keep:]
         
-        for thread in cleaned_up:
-            if thread in self.threads_to_cleanup:
-                self.threads_to_cleanup.remove(thread)
+        if not threads:
+            self.cleanup_timer.stop()
 
 
     def load_ui_settings(self):
@@ -1063,6 +1043,8 @@ class ServerMonitor(QMainWindow):
 
     def clear_log_only(self):
         """Clear activity log without affecting stats or settings"""
+        self.log_lines.clear()
+        self.log_lines.append("Activity log cleared...")
         self.log_text.setPlainText("Activity log cleared...")
         
     def save_current_settings(self):
@@ -1095,6 +1077,17 @@ class ServerMonitor(QMainWindow):
         
         event.accept()
 
+    def hideEvent(self, event):
+        """Pause UI refreshes while the window is hidden or minimized"""
+        self.ui_timer.stop()
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        """Resume UI refreshes if monitoring is running"""
+        super().showEvent(event)
+        if self.stop_btn.isEnabled() and not self.ui_timer.isActive():
+            self.ui_timer.start(1000)
+
     def scan_audio_files(self):
         sounds = ["System Default"]
         
@@ -1465,6 +1458,7 @@ class ServerMonitor(QMainWindow):
         self.log_text = QTextEdit()
         self.log_text.setMaximumHeight(120)
         self.log_text.setMinimumHeight(120)
+        self.log_lines.append("Multi-server monitor ready...")
         self.log_text.setPlainText("Multi-server monitor ready...")
         log_layout.addWidget(self.log_text)
         layout.addWidget(log_group)
@@ -1545,7 +1539,7 @@ class ServerMonitor(QMainWindow):
                 old_thread = self.monitor_threads[server_name]
                 if old_thread.running:
                     old_thread.stop()
-                    self.threads_to_cleanup.append(old_thread)
+                    self._queue_thread_cleanup(old_thread)
                     # Brief pause to let thread begin stopping
                     QApplication.processEvents()
             
@@ -1576,7 +1570,7 @@ class ServerMonitor(QMainWindow):
             thread = self.monitor_threads[server_name]
             if thread.running:
                 thread.stop()
-                self.threads_to_cleanup.append(thread)
+                self._queue_thread_cleanup(thread)
             
             # Remove from active threads immediately
             if server_name in self.monitor_threads:
@@ -1645,8 +1639,6 @@ class ServerMonitor(QMainWindow):
         
     def detect_active_server_connections(self):
         try:
-            import subprocess
-            
             # Check if netstat is available
             try:
                 # Run netstat to get active connections
@@ -1720,19 +1712,7 @@ class ServerMonitor(QMainWindow):
         
         # Reset all server cards to stopped state and clear all flags
         for card in self.server_cards.values():
-            card.is_monitoring_disabled = False
-            card.is_starting = False
-            card.status_text.setText("STOPPED")
-            card.status_text.setStyleSheet("font-weight: bold; font-size: 12px; color: #ffab40;")
-            card.status_indicator.setStyleSheet("color: #757575; font-size: 20px;")
-            card.setStyleSheet("""
-                QWidget {
-                    background-color: #404040;
-                    border: 2px solid #555555;
-                    border-radius: 8px;
-                    margin: 2px;
-                }
-            """)
+            card.set_to_stopped_state()
         
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
@@ -2232,11 +2212,10 @@ class ServerMonitor(QMainWindow):
             elif status == "up_to_date":
                 # Only log this occasionally to avoid spam, or if explicitly requested via test launch
                 if hasattr(self, '_last_update_check_log'):
-                    import time
-                    if time.time() - self._last_update_check_log < 60:  # Don't spam within 60 seconds
+                    if time.perf_counter() - self._last_update_check_log < 60:  # Don't spam within 60 seconds
                         return
                 
-                self._last_update_check_log = time.time()
+                self._last_update_check_log = time.perf_counter()
                 self.add_to_log(f"✅ Client is up-to-date with {version}")
             
             # For unknown status, don't log anything to avoid confusion
@@ -2435,15 +2414,10 @@ class ServerMonitor(QMainWindow):
     
     def add_to_log(self, message):
         """Add message to log"""
-        current_log = self.log_text.toPlainText()
-        log_lines = current_log.split('\n') if current_log.strip() else []
-        
-        log_lines.append(message)
+        # Bounded buffer drops the oldest line once max_log_lines is reached
+        self.log_lines.append(message)
         
-        if len(log_lines) > self.max_log_lines:
-            log_lines = log_lines[-self.max_log_lines:]
-        
-        new_log = '\n'.join(log_lines)
+        new_log = '\n'.join(self.log_lines)
         self.log_text.setPlainText(new_log)
         
         # Scroll to bottom
@@ -2457,7 +2431,7 @@ class ServerMonitor(QMainWindow):
                     old_thread = self.manifest_thread
                     if old_thread.running:
                         old_thread.stop()
-                        self.threads_to_cleanup.append(old_thread)
+                        self._queue_thread_cleanup(old_thread)
                         QApplication.processEvents()
                 
                 # Create new manifest thread
@@ -2482,7 +2456,7 @@ class ServerMonitor(QMainWindow):
         """Non-blocking manifest thread stopping"""
         if self.manifest_thread and self.manifest_thread.running:
             self.manifest_thread.stop()
-            self.threads_to_cleanup.append(self.manifest_thread)
+            self._queue_thread_cleanup(self.manifest_thread)
             self.manifest_thread = None
             return True
         return False
@@ -2692,32 +2666,20 @@ class ServerMonitor(QMainWindow):
             if thread.running:
                 thread.stop()
                 stopped_servers.append(server_name)
-                self.threads_to_cleanup.append(thread)
+                self._queue_thread_cleanup(thread)
         
         self.monitor_threads.clear()
         
         # Stop manifest thread (non-blocking)
         if self.manifest_thread and self.manifest_thread.running:
             self.manifest_thread.stop()
-            self.threads_to_cleanup.append(self.manifest_thread)
+            self._queue_thread_cleanup(self.manifest_thread)
             stopped_servers.append("Game Client")
             self.manifest_thread = None
         
         # Reset all server cards
         for card in self.server_cards.values():
-            card.is_monitoring_disabled = False
-            card.is_starting = False
-            card.status_text.setText("STOPPED")
-            card.status_text.setStyleSheet("font-weight: bold; font-size: 12px; color: #ffab40;")
-            card.status_indicator.setStyleSheet("color: #757575; font-size: 20px;")
-            card.setStyleSheet("""
-                QWidget {
-                    background-color: #404040;
-                    border: 2px solid #555555;
-                    border-radius: 8px;
-                    margin: 2px;
-                }
-            """)
+            card.set_to_stopped_state()
         
         # Update UI state
         self.start_btn.setEnabled(True)
@@ -3002,9 +2964,9 @@ class ManifestMonitorThread(QThread):
         
     def run(self):
         while self.running and not self._stop_event.is_set():
-            start_time = time.time()
+            start_time = time.perf_counter()
             is_up, manifest_data = self.check_manifest()
-            check_duration = time.time() - start_time
+            check_duration = time.perf_counter() - start_time
             
             self.status_update.emit(self.server_name, is_up, check_duration, manifest_data)
             
@@ -3395,19 +3357,8 @@ class ManifestServerCard(ServerCard):
             self.client_status_label.setText("Manifest Offline")
             self.client_status_label.setStyleSheet("font-size: 9px; color: #f44336;")
         
-        self.status_text.setText(status_text)
-        self.status_text.setStyleSheet(f"font-weight: bold; font-size: 12px; color: {color};")
-        self.status_indicator.setStyleSheet(f"color: {color}; font-size: 20px;")
-        
-        border_color = color
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: #404040;
-                border: 2px solid {border_color};
-                border-radius: 8px;
-                margin: 2px;
-            }}
-        """)
+        self._set_status_display(status_text, color)
+        self._set_card_style(border_color=color)
         
         # Update uptime
         if self.total_checks > 0: